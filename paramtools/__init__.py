@@ -27,6 +27,7 @@ from paramtools.select import (
     select_eq,
     select_gt,
     select_gt_ix,
+    select_gt_ix_eq,
     select_ne,
 )
 from paramtools.typing import ValueObject
@@ -72,6 +73,7 @@ __all__ = [
     "select_eq",
     "select_gt",
     "select_gt_ix",
+    "select_gt_ix_eq",
     "select_ne",
     "read_json",
     "get_example_paths",
@@ -54,10 +54,13 @@ class Range(marshmallow_validate.Range):
     def validate_value_objects(self, value):
         if value["value"] is None:
             return None
+        # Convert once so that list values are checked against every bound
+        # with a single vectorized comparison.
+        arr = np.array(value["value"])
         msgs = []
         if self.min is not None:
             for min_vo in self.min:
-                if np.any(np.array(value["value"]) < min_vo["value"]):
+                if np.any(arr < min_vo["value"]):
                     msgs.append(
                         (self.error_min or self.message_min).format(
                             input=value["value"],
@@ -69,7 +72,7 @@ class Range(marshmallow_validate.Range):
                     )
         if self.max is not None:
             for max_vo in self.max:
-                if np.any(np.array(value["value"]) > max_vo["value"]):
+                if np.any(arr > max_vo["value"]):
                     msgs.append(
                         (self.error_max or self.message_max).format(
                             input=value["value"],
@@ -32,6 +32,8 @@ class InconsistentLabelsException(ParamToolsError):
 collision_list = [
     "_data",
     "_errors",
+    "_get_schemas",
+    "_schemas",
     "select_eq",
     "select_ne",
     "select_gt",
@@ -1,7 +1,8 @@
 import copy
 import os
-import json
+import sys
 import itertools
+import operator
 import warnings
 from collections import OrderedDict, defaultdict
 from functools import reduce
@@ -11,7 +12,15 @@ from marshmallow import ValidationError as MarshmallowValidationError
 
 from paramtools.schema_factory import SchemaFactory
 from paramtools import utils
-from paramtools.select import select_eq, select_ne, select_gt_ix, select_gt
+from paramtools.select import (
+    select_eq,
+    select_ne,
+    select_gt,
+    select_gt_ix_eq,
+    eq_func,
+    _criteria,
+    _select,
+)
 from paramtools.exceptions import (
     SparseValueObjectsException,
     ValidationError,
@@ -22,23 +31,69 @@ from paramtools.exceptions import (
 
 
 class Parameters:
+    """
+    Base class for parameter specifications. Subclasses set:
+
+        - defaults: Path to, or dict of, the default specification.
+        - field_map: Custom marshmallow fields for parameter types.
+        - array_first: If true, parameter attributes are NumPy arrays instead
+            of lists of value objects. The arrays are built lazily the first
+            time an attribute is accessed. So, a SparseValueObjectsException
+            for values that do not span the label space is raised when the
+            attribute is accessed, not by __init__, set_state or adjust.
+        - label_to_extend: Label to extend the parameters along.
+    """
+
     defaults = None
     field_map = {}
     array_first = False
     label_to_extend = None
+    _schemas = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._schemas = None
 
     def __init__(self, initial_state=None, array_first=None):
-        schemafactory = SchemaFactory(self.defaults, self.field_map)
         (
-            self._defaults_schema,
-            self._validator_schema,
-            self._data,
-        ) = schemafactory.schemas()
-        self.label_validators = schemafactory.label_validators
+            defaults_schema,
+            validator_schema,
+            data,
+            label_validators,
+        ) = self._get_schemas()
+        self._defaults_schema = defaults_schema
+        # The validator schema stores this instance in its context, so each
+        # instance needs its own copy.
+        self._validator_schema = type(validator_schema)()
+        # Each instance gets its own copy of the data. The value objects are
+        # copied one level deep, which is much cheaper than deep copying them,
+        # since list values are the only values that can be modified in place.
+        self._data = OrderedDict()
+        for param, param_data in data.items():
+            param_copy = {}
+            for key, item in param_data.items():
+                if key == "value":
+                    param_copy[key] = [
+                        (
+                            dict(vo, value=copy.deepcopy(vo["value"]))
+                            if isinstance(vo["value"], list)
+                            else dict(vo)
+                        )
+                        for vo in item
+                    ]
+                else:
+                    param_copy[key] = copy.deepcopy(item)
+            self._data[param] = param_copy
+        self.label_validators = label_validators
         self._stateless_label_grid = OrderedDict(
             [(name, v.grid()) for name, v in self.label_validators.items()]
         )
-        self.label_grid = copy.deepcopy(self._stateless_label_grid)
+        # The grids only hold label values, so copying each list is enough to
+        # keep label_grid independent of _stateless_label_grid.
+        self.label_grid = OrderedDict(
+            (name, list(values))
+            for name, values in self._stateless_label_grid.items()
+        )
         self._validator_schema.context["spec"] = self
         self._errors = {}
         self._state = initial_state or {}
@@ -56,6 +111,60 @@ class Parameters:
         else:
             self.set_state()
 
+    def _get_schemas(self):
+        """
+        Build the schemas and deserialized defaults for this instance.
+        Building them is expensive, so they are cached on the class and
+        re-built only if the class's defaults or field_map change. Defaults
+        or a field_map set on the instance are never cached.
+
+        The cache has some limits:
+            - Dict defaults are deep copied when they are cached and compared
+                with the cached copy on every instantiation, which is
+                proportional to the size of the defaults. Defaults that
+                contain NaN never compare equal and are re-built every time.
+            - Path defaults are keyed on the path, so changes to the file
+                are not picked up. Set `_schemas` to None on the class to
+                re-read it.
+
+        Returns: defaults schema, validator schema, deserialized defaults,
+            and label validators.
+        """
+        cls = type(self)
+        defaults, field_map = self.defaults, self.field_map
+        use_cache = (
+            "defaults" not in self.__dict__
+            and "field_map" not in self.__dict__
+        )
+        if (
+            use_cache
+            and cls._schemas is not None
+            and cls._schemas[0] == defaults
+            and cls._schemas[1] == field_map
+        ):
+            return cls._schemas[2:]
+        # Snapshot the defaults before building so that modifying them in
+        # place invalidates the cache.
+        key = (copy.deepcopy(defaults), dict(field_map))
+        schemafactory = SchemaFactory(defaults, field_map)
+        defaults_schema, validator_schema, data = schemafactory.schemas()
+        # Label values are compared on every select. Interning the ones
+        # parsed from JSON lets equal strings compare by identity.
+        for param_data in data.values():
+            for vo in param_data["value"]:
+                for label, label_value in vo.items():
+                    if label != "value" and isinstance(label_value, str):
+                        vo[label] = sys.intern(label_value)
+        schemas = (
+            defaults_schema,
+            validator_schema,
+            data,
+            schemafactory.label_validators,
+        )
+        if use_cache:
+            cls._schemas = key + schemas
+        return schemas
+
     def set_state(self, **labels):
         """
         Sets state for the Parameters instance. The state, label_grid, and
@@ -74,7 +183,10 @@ class Parameters:
         Reset the state of the Parameters instance.
         """
         self._state = {}
-        self.label_grid = copy.deepcopy(self._stateless_label_grid)
+        self.label_grid = OrderedDict(
+            (name, list(values))
+            for name, values in self._stateless_label_grid.items()
+        )
         self.set_state()
 
     def view_state(self):
@@ -85,9 +197,10 @@ class Parameters:
 
     def read_params(self, params_or_path):
         if isinstance(params_or_path, str) and os.path.exists(params_or_path):
-            params = utils.read_json(params_or_path)
+            with open(params_or_path, "rb") as f:
+                params = utils.json_loads(f.read())
         elif isinstance(params_or_path, str):
-            params = json.loads(params_or_path)
+            params = utils.json_loads(params_or_path)
         elif isinstance(params_or_path, dict):
             params = params_or_path
         else:
@@ -121,6 +234,9 @@ class Parameters:
         if not self._errors:
             if self.label_to_extend is not None and extend_adj:
                 extend_grid = self._stateless_label_grid[self.label_to_extend]
+                # Labels that are not matched exactly when selecting the value
+                # objects that will be overwritten by extend.
+                not_eq = (self.label_to_extend, "value")
                 for param, vos in parsed_params.items():
                     to_delete = []
                     for vo in utils.grid_sort(
@@ -138,7 +254,7 @@ class Parameters:
                                     f"{self.label_grid[self.label_to_extend]}."
                                 )
                                 warnings.warn(msg)
-                            gt = select_gt_ix(
+                            eq = select_gt_ix_eq(
                                 self._data[param]["value"],
                                 True,
                                 {
@@ -146,40 +262,34 @@ class Parameters:
                                         self.label_to_extend
                                     ]
                                 },
+                                {
+                                    k: v
+                                    for k, v in vo.items()
+                                    if k not in not_eq
+                                },
                                 extend_grid,
                             )
-                            eq = select_eq(
-                                gt,
-                                True,
-                                utils.filter_labels(
-                                    vo, drop=[self.label_to_extend, "value"]
-                                ),
-                            )
                             to_delete += eq
                     to_delete = [
                         dict(td, **{"value": None}) for td in to_delete
                     ]
-                    # make copy of value objects since they
-                    # are about to be modified
-                    backup = copy.deepcopy(self._data[param]["value"])
+                    # make copy of value objects since they are about to be
+                    # modified. _update_param replaces value objects instead
+                    # of mutating them, so a shallow copy is sufficient.
+                    backup = list(self._data[param]["value"])
                     try:
-                        array_first = self.array_first
-                        self.array_first = False
-                        # delete params that will be overwritten out by extend.
-                        self.adjust(
-                            {param: to_delete},
-                            extend_adj=False,
-                            raise_errors=True,
-                        )
-                        # set user adjustments.
-                        self.adjust(
-                            {param: vos}, extend_adj=False, raise_errors=True
-                        )
-                        self.array_first = array_first
+                        # to_delete is built from existing value objects
+                        # and vos was validated above, so both are applied
+                        # directly instead of being re-validated by adjust.
+                        # Value objects are applied in order, so this deletes
+                        # params that will be overwritten by extend and then
+                        # sets the user adjustments in a single update.
+                        self._update_param(param, to_delete + vos)
                         # extend user adjustments.
                         self.extend(params=[param], raise_errors=True)
                     except ValidationError:
                         self._data[param]["value"] = backup
+                        self.__dict__.pop(param, None)
             else:
                 for param, value in parsed_params.items():
                     self._update_param(param, value)
@@ -189,9 +299,8 @@ class Parameters:
         if raise_errors and self._errors:
             raise self.validation_error
 
-        # Update attrs for params that were adjusted.
-        self._set_state(params=parsed_params.keys())
-
+        # The attributes of the adjusted params were dropped by _update_param
+        # and are re-computed the next time that they are accessed.
         return parsed_params
 
     @property
@@ -233,9 +342,12 @@ class Parameters:
         if use_state:
             labels.update(self._state)
 
+        # The criteria are the same for every parameter, so they are built
+        # once for the whole query.
+        criteria = _criteria(labels, eq_func)
         all_params = OrderedDict()
         for param in self._validator_schema.fields:
-            result = self.select_eq(param, False, **labels)
+            result = _select(self._data[param]["value"], False, criteria, all)
             if result or include_empty:
                 if meta_data:
                     param_data = self._data[param]
@@ -271,19 +383,13 @@ class Parameters:
         value_items = self.select_eq(param, False, **self._state)
         if not value_items:
             return np.array([])
-        label_order, value_order = self._resolve_order(param)
-        shape = []
-        for label in label_order:
-            shape.append(len(value_order[label]))
-        shape = tuple(shape)
+        label_order, value_order = self._resolve_order(param, value_items)
+        shape = tuple(len(value_order[label]) for label in label_order)
         arr = np.empty(shape, dtype=self._numpy_type(param))
         # Compare len value items with the expected length if they are full.
         # In the futute, sparse objects should be supported by filling in the
         # unspecified labels.
-        if not shape:
-            exp_full_shape = 1
-        else:
-            exp_full_shape = reduce(lambda x, y: x * y, shape)
+        exp_full_shape = reduce(operator.mul, shape, 1)
         if len(value_items) != exp_full_shape:
             # maintains label value order over value objects.
             exp_grid = list(itertools.product(*value_order.values()))
@@ -300,20 +406,45 @@ class Parameters:
                 f"parameter space. Missing combinations:\n\t{missing}"
             )
 
-        def list_2_tuple(x):
-            return tuple(x) if isinstance(x, list) else x
-
-        for vi in value_items:
-            # ix stores the indices of `arr` that need to be filled in.
-            ix = [[] for i in range(len(label_order))]
-            for label_pos, label_name in enumerate(label_order):
-                # assume value_items is dense in the sense that it spans
-                # the label space.
-                ix[label_pos].append(
-                    value_order[label_name].index(vi[label_name])
+        if not label_order:
+            arr[()] = value_items[0]["value"]
+            return arr
+
+        if arr.dtype != object and all(
+            tuple(vi[label_name] for label_name in label_order) == exp
+            for vi, exp in zip(
+                value_items, itertools.product(*value_order.values())
+            )
+        ):
+            # The value objects are already in the array's (C-order) element
+            # order, so they can be written to it without any indexing.
+            arr.reshape(-1)[:] = [vi["value"] for vi in value_items]
+            return arr
+
+        # ix stores the indices of `arr` that need to be filled in. They are
+        # resolved one label at a time so that each index array is built
+        # with a single np.fromiter call.
+        ix = []
+        for label_name in label_order:
+            # Map each label value to its position along the label's axis.
+            pos = {val: i for i, val in enumerate(value_order[label_name])}
+            # assume value_items is dense in the sense that it spans
+            # the label space.
+            ix.append(
+                np.fromiter(
+                    (pos[vi[label_name]] for vi in value_items),
+                    dtype=np.intp,
+                    count=len(value_items),
                 )
-            ix = tuple(map(list_2_tuple, ix))
-            arr[ix] = vi["value"]
+            )
+        if arr.dtype == object:
+            # Fill element-wise so that values like lists are not broadcast.
+            vals = np.empty(len(value_items), dtype=object)
+            for i, vi in enumerate(value_items):
+                vals[i] = vi["value"]
+        else:
+            vals = [vi["value"] for vi in value_items]
+        arr[tuple(ix)] = vals
         return arr
 
     def from_array(self, param, array=None):
@@ -326,6 +457,8 @@ class Parameters:
         Raises:
             InconsistentLabelsException: Value objects do not have consistent
                 labels.
+            ValueError: The shape of the array does not match the shape
+                specified by the labels.
         """
         if array is None:
             array = getattr(self, param)
@@ -335,14 +468,19 @@ class Parameters:
                     "or the instance attribute should be an array."
                 )
         label_order, value_order = self._resolve_order(param)
+        shape = tuple(len(value_order[label]) for label in label_order)
+        if array.shape != shape:
+            raise ValueError(
+                f"The array for {param} has shape {array.shape} but the "
+                f"labels for {param} specify shape {shape}."
+            )
+        # itertools.product varies the last label fastest which matches
+        # the order of the elements in the raveled (C-order) array.
         label_values = itertools.product(*value_order.values())
-        label_indices = itertools.product(
-            *map(lambda x: range(len(x)), value_order.values())
-        )
         value_items = []
-        for dv, di in zip(label_values, label_indices):
-            vi = {label_order[j]: dv[j] for j in range(len(dv))}
-            vi["value"] = array[di]
+        for dv, value in zip(label_values, array.ravel()):
+            vi = dict(zip(label_order, dv))
+            vi["value"] = value
             value_items.append(vi)
         return value_items
 
@@ -357,14 +495,31 @@ class Parameters:
         if label_to_extend is None:
             label_to_extend = self.label_to_extend
 
-        spec = self.specification(meta_data=True)
         if params is not None:
             spec = {
                 param: self._data[param]
-                for param, data in spec.items()
+                for param in self._validator_schema.fields
                 if param in params
+                and self.select_eq(param, False, **self._state)
             }
+        else:
+            spec = self.specification(meta_data=True)
         extend_grid = self._stateless_label_grid[label_to_extend]
+        # Map each grid value to its position to avoid list.index lookups.
+        idx_of = {val: ix for ix, val in enumerate(extend_grid)}
+        label_names = tuple(self._stateless_label_grid)
+
+        def vo_key(vo):
+            # Value objects are identified by their label values. The value
+            # is left out since it does not affect extension and may be an
+            # unhashable list.
+            return tuple(
+                (label, vo[label]) for label in label_names if label in vo
+            )
+
+        # Labels that are not matched exactly when selecting the value
+        # objects that are extended along with vo.
+        not_eq = ("value", label_to_extend)
         adjustment = defaultdict(list)
         for param, data in spec.items():
             if not any(label_to_extend in vo for vo in data["value"]):
@@ -372,33 +527,29 @@ class Parameters:
             extended_vos = set()
             for vo in sorted(
                 data["value"],
-                key=lambda val: extend_grid.index(val[label_to_extend]),
+                key=lambda val: idx_of[val[label_to_extend]],
             ):
-                hashable_vo = utils.hashable_value_object(vo)
-                if hashable_vo in extended_vos:
+                key = vo_key(vo)
+                if key in extended_vos:
                     continue
                 else:
-                    extended_vos.add(hashable_vo)
-                gt = select_gt_ix(
+                    extended_vos.add(key)
+                eq = select_gt_ix_eq(
                     self._data[param]["value"],
                     True,
                     {label_to_extend: vo[label_to_extend]},
+                    {k: v for k, v in vo.items() if k not in not_eq},
                     extend_grid,
                 )
-                eq = select_eq(
-                    gt,
-                    True,
-                    utils.filter_labels(vo, drop=["value", label_to_extend]),
-                )
-                extended_vos.update(map(utils.hashable_value_object, eq))
+                extended_vos.update(map(vo_key, eq))
                 eq += [vo]
 
                 defined_vals = {eq_vo[label_to_extend] for eq_vo in eq}
 
-                missing_vals = sorted(
-                    set(extend_grid) - defined_vals,
-                    key=lambda val: extend_grid.index(val),
-                )
+                # Scanning the grid keeps missing_vals in grid order.
+                missing_vals = [
+                    val for val in extend_grid if val not in defined_vals
+                ]
 
                 if not missing_vals:
                     continue
@@ -406,11 +557,12 @@ class Parameters:
                 extended = defaultdict(list)
 
                 for val in missing_vals:
-                    eg_ix = extend_grid.index(val)
+                    eg_ix = idx_of[val]
                     if eg_ix == 0:
-                        first_defined_value = min(
-                            defined_vals,
-                            key=lambda val: extend_grid.index(val),
+                        first_defined_value = next(
+                            grid_val
+                            for grid_val in extend_grid
+                            if grid_val in defined_vals
                         )
                         value_objects = select_eq(
                             eq, True, {label_to_extend: first_defined_value}
@@ -428,9 +580,7 @@ class Parameters:
                     # matched multiple value objects.
                     for value_object in value_objects:
                         ext = dict(value_object, **{label_to_extend: val})
-                        extended_vos.add(
-                            utils.hashable_value_object(value_object)
-                        )
+                        extended_vos.add(vo_key(value_object))
                         extended[val].append(ext)
                         adjustment[param].append(ext)
         # Ensure that the adjust method of paramtools.Parameter is used
@@ -444,6 +594,8 @@ class Parameters:
         Private method for setting the state on a Parameters instance. Internal
         methods can set which params will be updated. This is helpful when a set
         of parameters are adjusted and only their attributes need to be updated.
+        If params are specified, their attributes are always updated. Otherwise,
+        all attributes are updated.
 
         """
         messages = {}
@@ -465,20 +617,57 @@ class Parameters:
             if not isinstance(label_value, list):
                 label_value = [label_value]
             self.label_grid[label_name] = label_value
-        spec = self.specification(include_empty=True, **self._state)
-        if params is not None:
-            spec = {param: spec[param] for param in params}
-        for name, value in spec.items():
+        if params is None:
+            params = self._validator_schema.fields
+        for name in params:
             if name in collision_list:
                 raise ParameterNameCollisionException(
                     f"The paramter name, '{name}', is already used by the Parameters object."
                 )
+            # Drop the stale attribute. It is re-computed by __getattr__ the
+            # next time that it is accessed.
+            self.__dict__.pop(name, None)
+
+    def __getattr__(self, name):
+        """
+        Parameter attributes are computed lazily from the current state the
+        first time that they are accessed after the state or the parameter's
+        values have changed. This avoids calling to_array or select_eq for
+        parameters that are never accessed.
+
+        Raises:
+            AttributeError: name is not an attribute or a parameter.
+            RuntimeError: an AttributeError was raised while computing the
+                parameter's attribute.
+        """
+        validator_schema = self.__dict__.get("_validator_schema")
+        if validator_schema is None or name not in validator_schema.fields:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        # Python treats an AttributeError raised here as a missing
+        # attribute, so internal errors are re-raised as a different type.
+        try:
             if self.array_first:
-                setattr(self, name, self.to_array(name))
+                value = self.to_array(name)
             else:
-                setattr(self, name, value)
+                value = self.select_eq(name, False, **self._state)
+        except AttributeError as e:
+            raise RuntimeError(
+                f"Unable to compute the attribute for parameter '{name}': {e}"
+            ) from e
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        """
+        Include the lazily computed parameter attributes.
+        """
+        return sorted(
+            set(super().__dir__()) | set(self.__dict__.get("_data", ()))
+        )
 
-    def _resolve_order(self, param):
+    def _resolve_order(self, param, value_items=None):
         """
         Resolve the order of the labels and their values by
         inspecting data in the label grid values.
@@ -489,6 +678,9 @@ class Parameters:
         _consistently_ for all value objects, i.e. none can be added or omitted
         for any value object in the list.
 
+        The value objects selected under the current state may be passed
+        as value_items if the caller has already selected them.
+
         Returns:
             label_order: The label order.
             value_order: The values, in order, for each label.
@@ -497,7 +689,8 @@ class Parameters:
             InconsistentLabelsException: Value objects do not have consistent
                 labels.
         """
-        value_items = self.select_eq(param, False, **self._state)
+        if value_items is None:
+            value_items = self.select_eq(param, False, **self._state)
         used = utils.consistent_labels(value_items)
         if used is None:
             raise InconsistentLabelsException(
@@ -533,7 +726,9 @@ class Parameters:
         the adjustment. The values that need to be updated are chosen
         by finding all value items with label values matching the
         label values specified in the adjustment. If the value is
-        set to None, then that value object will be removed.
+        set to None, then that value object will be removed. The new
+        values are applied in order, so one call with several new values
+        has the same result as one call per new value.
 
         Note: _update_param used to raise a ParameterUpdateException if one of the new
             values did not match at least one of the current value objects. However,
@@ -545,33 +740,53 @@ class Parameters:
             For now, no exceptions are raised by this method.
 
         """
-        for i in range(len(new_values)):
-            curr_vals = self._data[param]["value"]
-            matched_at_least_once = False
-            labels_to_check = tuple(k for k in new_values[i] if k != "value")
-            to_delete = []
-            for j in range(len(curr_vals)):
-                match = all(
-                    curr_vals[j][k] == new_values[i][k]
-                    for k in labels_to_check
-                )
-                if match:
-                    matched_at_least_once = True
-                    if new_values[i]["value"] is None:
-                        to_delete.append(j)
-                    else:
-                        curr_vals[j]["value"] = new_values[i]["value"]
-            if to_delete:
-                # Iterate in reverse so that indices point to the correct
-                # value. If iterating ascending then the values will be shifted
-                # towards the front of the list as items are removed.
-                for ix in sorted(to_delete, reverse=True):
-                    del curr_vals[ix]
-            if (
-                not matched_at_least_once
-                and new_values[i]["value"] is not None
-            ):
-                curr_vals.append(new_values[i])
+        curr_vals = self._data[param]["value"]
+        # Positions of value objects that are removed at the end of the
+        # update. Removing them right away would shift the positions stored
+        # in the index.
+        deleted = set()
+        # Index the current value objects on the values of the labels that
+        # are specified in the new value object. The index is only rebuilt
+        # when a new value object specifies a different set of labels.
+        index, index_labels = None, None
+        missing = object()
+        changed = False
+        for new_vo in new_values:
+            labels_to_check = tuple(k for k in new_vo if k != "value")
+            if labels_to_check != index_labels:
+                index_labels = labels_to_check
+                index = defaultdict(list)
+                for j, curr_vo in enumerate(curr_vals):
+                    if j not in deleted:
+                        key = tuple(
+                            curr_vo.get(k, missing) for k in labels_to_check
+                        )
+                        index[key].append(j)
+            key = tuple(new_vo[k] for k in labels_to_check)
+            matches = index.get(key)
+            if new_vo["value"] is None:
+                if matches:
+                    deleted.update(matches)
+                    del index[key]
+                    changed = True
+            elif matches:
+                changed = True
+                for j in matches:
+                    # Replace instead of mutating the value object so
+                    # that shallow copies of the list remain intact.
+                    curr_vals[j] = dict(curr_vals[j], value=new_vo["value"])
+            else:
+                index[key].append(len(curr_vals))
+                curr_vals.append(new_vo)
+                changed = True
+        if deleted:
+            curr_vals[:] = [
+                vo for j, vo in enumerate(curr_vals) if j not in deleted
+            ]
+        if changed:
+            # Drop the stale attribute. It is re-computed by __getattr__ the
+            # next time that it is accessed.
+            self.__dict__.pop(param, None)
 
     def _parse_errors(self, ve, params):
         """
@@ -141,6 +141,18 @@ class BaseValidatorSchema(Schema):
         "choice": "_get_choice_validator",
     }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Positions of the label_to_extend grid values, by label.
+        self._extend_idx = {}
+        # Choice validators, by parameter name and label string.
+        self._choice_validators = {}
+        # Range error templates, by parameter and compared parameter names.
+        self._range_errors = {}
+        # Indexes of the value objects that adjusted values are compared
+        # against. Reset by validate_params for each validation pass.
+        self._comparable_index = {}
+
     @validates_schema
     def validate_params(self, data, **kwargs):
         """
@@ -149,6 +161,10 @@ class BaseValidatorSchema(Schema):
         parameters have been validated. Note that all data has been
         type-validated. These methods only do range validation.
         """
+        # The comparable value indexes are shared by all value objects in
+        # this pass, but must be rebuilt for the next one since the data may
+        # change.
+        self._comparable_index = {}
         errors = defaultdict(dict)
         errors_exist = False
         for name, specs in data.items():
@@ -210,8 +226,15 @@ class BaseValidatorSchema(Schema):
             )
         min_vos = self._sort_by_label_to_extend(min_vos)
         max_vos = self._sort_by_label_to_extend(max_vos)
-        error_min = f"{param_name}{{labels}} {{input}} < min {{min}} {min_oth_param}{{oth_labels}}"
-        error_max = f"{param_name}{{labels}} {{input}} > max {{max}} {max_oth_param}{{oth_labels}}"
+        # The error templates only depend on the parameter names, so they
+        # are built once and reused for every value object.
+        key = (param_name, min_oth_param, max_oth_param)
+        if key not in self._range_errors:
+            self._range_errors[key] = (
+                f"{param_name}{{labels}} {{input}} < min {{min}} {min_oth_param}{{oth_labels}}",
+                f"{param_name}{{labels}} {{input}} > max {{max}} {max_oth_param}{{oth_labels}}",
+            )
+        error_min, error_max = self._range_errors[key]
         return range_class(
             min_vo=min_vos,
             max_vo=max_vos,
@@ -222,25 +245,43 @@ class BaseValidatorSchema(Schema):
     def _sort_by_label_to_extend(self, vos):
         label_to_extend = self.context["spec"].label_to_extend
         if label_to_extend is not None:
-            label_grid = self.context["spec"]._stateless_label_grid
-            extend_vals = label_grid[label_to_extend]
+            idx_of = self._get_extend_idx(label_to_extend)
             return sorted(
                 vos,
                 key=lambda vo: (
-                    extend_vals.index(vo[label_to_extend])
+                    idx_of.get(vo[label_to_extend], 9e99)
                     if label_to_extend in vo
-                    and vo[label_to_extend] in extend_vals
                     else 9e99
                 ),
             )
         else:
             return vos
 
+    def _get_extend_idx(self, label_to_extend):
+        """
+        Map each value in the label_to_extend grid to its position. The
+        stateless label grid does not change over the lifetime of the
+        Parameters instance, so the map is computed once and reused.
+        """
+        extend_idx = self._extend_idx
+        if label_to_extend not in extend_idx:
+            label_grid = self.context["spec"]._stateless_label_grid
+            extend_idx[label_to_extend] = {
+                val: ix for ix, val in enumerate(label_grid[label_to_extend])
+            }
+        return extend_idx[label_to_extend]
+
     def _get_choice_validator(
         self, vname, choice_dict, param_name, param_spec, raw_data
     ):
-        choices = choice_dict["choices"]
         labels = utils.make_label_str(param_spec)
+        # The validator only depends on the parameter's choices and the
+        # labels in the error message, so it is built once per parameter
+        # and label combination and reused across adjustments.
+        cache = self._choice_validators
+        if (param_name, labels) in cache:
+            return cache[(param_name, labels)]
+        choices = choice_dict["choices"]
         label_suffix = f" for labels {labels}" if labels else ""
         if len(choices) < 20:
             error_template = (
@@ -256,7 +297,9 @@ class BaseValidatorSchema(Schema):
             choices="{choices}",
             label_suffix=label_suffix,
         )
-        return contrib_validate.OneOf(choices, error=error)
+        validator = contrib_validate.OneOf(choices, error=error)
+        cache[(param_name, labels)] = validator
+        return validator
 
     def _resolve_op_value(self, op_value, param_name, param_spec, raw_data):
         """
@@ -283,20 +326,28 @@ class BaseValidatorSchema(Schema):
           - second, look in the defaults data
         """
         if oth_param_name in raw_data:
+            source = ("raw", oth_param_name)
             vals = raw_data[oth_param_name]
         else:
             # If comparing against the "default" value then get the current
             # value of the parameter being updated.
             if oth_param_name == "default":
-                oth_param = self.context["spec"]._data[param_name]
+                source = ("data", param_name)
             else:
-                oth_param = self.context["spec"]._data[oth_param_name]
-            vals = oth_param["value"]
-        res = [
-            val
-            for val in vals
-            if all(val[k] == param_spec[k] for k in param_spec if k != "value")
-        ]
+                source = ("data", oth_param_name)
+            vals = self.context["spec"]._data[source[1]]["value"]
+        labels = tuple(k for k in param_spec if k != "value")
+        # Index the candidate value objects on the labels of the adjusted
+        # value object once instead of scanning them for every value object.
+        index_cache = self._comparable_index
+        if (source, labels) not in index_cache:
+            missing = object()
+            index = defaultdict(list)
+            for val in vals:
+                index[tuple(val.get(k, missing) for k in labels)].append(val)
+            index_cache[(source, labels)] = index
+        index = index_cache[(source, labels)]
+        res = list(index.get(tuple(param_spec[k] for k in labels), []))
         return oth_param_name, res
 
 
@@ -8,16 +8,41 @@ def select(value_objects, exact_match, cmp_func, agg_cmp_func, labels):
 
     Returns: [{"value": val, "label0": ..., }]
     """
+    return _select(
+        value_objects, exact_match, _criteria(labels, cmp_func), agg_cmp_func
+    )
+
+
+def _criteria(labels, cmp_func):
+    """
+    Pair each label with its comparison function. The label values are
+    normalized once here instead of once per value object.
+    """
+    return [
+        (
+            label_name,
+            label_value if isinstance(label_value, list) else (label_value,),
+            cmp_func,
+        )
+        for label_name, label_value in labels.items()
+    ]
+
+
+def _select(value_objects, exact_match, criteria, agg_cmp_func):
+    if not criteria:
+        return list(value_objects) if agg_cmp_func([]) else []
+    # all and any short-circuit on a generator. Other aggregate functions
+    # may need a sequence, e.g. to take its length.
+    lazy = agg_cmp_func in (all, any)
     ret = []
     for value_object in value_objects:
-        matches = []
-        for label_name, label_value in labels.items():
-            if label_name in value_object or exact_match:
-                if isinstance(label_value, list):
-                    match = cmp_func(value_object[label_name], label_value)
-                else:
-                    match = cmp_func(value_object[label_name], (label_value,))
-                matches.append(match)
+        matches = (
+            cmp_func(value_object[label_name], label_value)
+            for label_name, label_value, cmp_func in criteria
+            if label_name in value_object or exact_match
+        )
+        if not lazy:
+            matches = list(matches)
         if agg_cmp_func(matches):
             ret.append(value_object)
     return ret
@@ -52,11 +77,47 @@ def select_gt(value_objects, exact_match, labels):
     return select(value_objects, exact_match, gt_func, all, labels)
 
 
+def _gt_ix_cmp(cmp_list):
+    """
+    Same comparison as gt_ix_func, but positions are looked up in a dict
+    that is built once instead of with list.index on every comparison.
+    """
+    ix_of = {}
+    for ix, item in enumerate(cmp_list):
+        # list.index returns the first position of an item.
+        ix_of.setdefault(item, ix)
+
+    def index(item):
+        try:
+            return ix_of[item]
+        except KeyError:
+            raise ValueError(f"{item!r} is not in list") from None
+
+    def cmp_func(x, y):
+        x_val = index(x)
+        return all(x_val > index(item) for item in y)
+
+    return cmp_func
+
+
 def select_gt_ix(value_objects, exact_match, labels, cmp_list):
     return select(
-        value_objects,
-        exact_match,
-        lambda x, y: gt_ix_func(cmp_list, x, y),
-        all,
-        labels,
+        value_objects, exact_match, _gt_ix_cmp(cmp_list), all, labels
+    )
+
+
+def select_gt_ix_eq(
+    value_objects, exact_match, gt_labels, eq_labels, cmp_list
+):
+    """
+    Select the value objects that are greater than `gt_labels`, compared by
+    their position in `cmp_list`, and equal to `eq_labels`. This gives the
+    same result as chaining `select_gt_ix` and `select_eq` but only scans
+    `value_objects` once.
+
+    Returns: [{"value": val, "label0": ..., }]
+    """
+    criteria = _criteria(gt_labels, _gt_ix_cmp(cmp_list)) + _criteria(
+        eq_labels, eq_func
     )
+    return _select(value_objects, exact_match, criteria, all)
@@ -1,5 +1,6 @@
 import copy
 import os
+import sys
 import json
 import datetime
 from collections import OrderedDict
@@ -16,31 +17,47 @@ from paramtools import (
 )
 
 from paramtools import Parameters
+from paramtools.utils import json_loads
 
 CURRENT_PATH = os.path.abspath(os.path.dirname(__file__))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def defaults_spec_path():
     return os.path.join(CURRENT_PATH, "defaults.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def extend_ex_path():
     return os.path.join(CURRENT_PATH, "extend_ex.json")
 
 
+@pytest.fixture(scope="session")
+def parsed_defaults(defaults_spec_path):
+    """
+    defaults.json is only read once per session. Do not modify the result,
+    use the defaults fixture for a copy that can be modified.
+    """
+    with open(defaults_spec_path, "rb") as f:
+        return json_loads(f.read())
+
+
 @pytest.fixture
-def array_first_defaults(defaults_spec_path):
-    with open(defaults_spec_path) as f:
-        r = json.loads(f.read())
-    r.pop("float_list_param")
-    r.pop("simple_int_list_param")
-    return r
+def defaults(parsed_defaults):
+    return copy.deepcopy(parsed_defaults)
 
 
 @pytest.fixture
+def array_first_defaults(defaults):
+    defaults.pop("float_list_param")
+    defaults.pop("simple_int_list_param")
+    return defaults
+
+
+@pytest.fixture(scope="session")
 def TestParams(defaults_spec_path):
+    # The class is shared by all tests so that its schemas are only built
+    # once. Each instance still gets its own copy of the parameter values.
     class _TestParams(Parameters):
         defaults = defaults_spec_path
 
@@ -68,6 +85,63 @@ def test_init(TestParams):
     assert params.label_grid == params._stateless_label_grid
 
 
+def test_schemas_cached(TestParams):
+    params1 = TestParams()
+    params2 = TestParams()
+    assert params1._defaults_schema is params2._defaults_schema
+    assert params1._validator_schema is not params2._validator_schema
+    assert params1._validator_schema.context["spec"] is params1
+    assert params2._validator_schema.context["spec"] is params2
+
+    params1.adjust({"min_int_param": [{"label0": "zero", "value": 3}]})
+    assert params1.min_int_param != params2.min_int_param
+    assert params2._data["min_int_param"]["value"] == (
+        TestParams().min_int_param
+    )
+    label_value = params2._data["min_int_param"]["value"][0]["label0"]
+    assert label_value is sys.intern("zero")
+
+    params1._data["float_list_param"]["value"][0]["value"].append(3.0)
+    params1._data["min_int_param"]["value"][0]["label0"] = "one"
+    params3 = TestParams()
+    assert params3._data["float_list_param"] == (
+        params2._data["float_list_param"]
+    )
+    assert params3.min_int_param == params2.min_int_param
+
+
+def test_instance_defaults(defaults_spec_path, defaults):
+    class InstanceParams(Parameters):
+        def __init__(self, *args, **kwargs):
+            self.defaults = defaults_spec_path
+            super().__init__(*args, **kwargs)
+
+    params = InstanceParams()
+    assert params.min_int_param == [
+        {"label0": "zero", "label1": 1, "value": 1},
+        {"label0": "one", "label1": 2, "value": 2},
+    ]
+    assert InstanceParams._schemas is None
+
+    class DictParams(Parameters):
+        pass
+
+    DictParams.defaults = defaults
+    DictParams()
+    defaults["min_int_param"]["value"][0]["value"] = 3
+    assert DictParams().min_int_param[0]["value"] == 3
+
+
+def test_metadata_not_shared(TestParams):
+    params1 = TestParams()
+    params2 = TestParams()
+    spec = params1.specification(meta_data=True)
+    spec["min_int_param"]["validators"]["range"]["min"] = 5
+    exp = {"range": {"min": 0, "max": "max_int_param"}}
+    assert params2._data["min_int_param"]["validators"] == exp
+    assert TestParams()._data["min_int_param"]["validators"] == exp
+
+
 class TestSchema:
     def test_empty_schema(self):
         class Params(Parameters):
@@ -129,9 +203,8 @@ class TestSchema:
         assert params.hello_world == "hello world"
         assert params.label_grid == {}
 
-    def test_schema_not_dropped(self, defaults_spec_path):
-        with open(defaults_spec_path, "r") as f:
-            defaults_ = json.loads(f.read())
+    def test_schema_not_dropped(self, defaults):
+        defaults_ = defaults
 
         class TestParams(Parameters):
             defaults = defaults_
@@ -141,12 +214,11 @@ class TestSchema:
 
 
 class TestAccess:
-    def test_specification(self, TestParams, defaults_spec_path):
+    def test_specification(self, TestParams, defaults):
         params = TestParams()
         spec1 = params.specification()
 
-        with open(defaults_spec_path) as f:
-            exp = json.loads(f.read())
+        exp = defaults
         exp.pop("schema")
 
         assert set(spec1.keys()) == set(exp.keys())
@@ -188,7 +260,7 @@ class TestAccess:
         assert "str_choice_param" not in params.specification()
         assert "str_choice_param" in params.specification(include_empty=True)
 
-    def test_serializable(self, TestParams, defaults_spec_path):
+    def test_serializable(self, TestParams, defaults):
         params = TestParams()
 
         assert json.dumps(params.specification(serializable=True))
@@ -201,8 +273,7 @@ class TestAccess:
         for value in spec.values():
             assert "value" not in value
 
-        with open(defaults_spec_path) as f:
-            exp = json.loads(f.read())
+        exp = defaults
         exp.pop("schema")
 
         spec = params.specification(serializable=True, meta_data=True)
@@ -315,6 +386,50 @@ class TestAdjust:
             == 18
         )
 
+    def test_adjust_mixed_labels(self, TestParams):
+        params = TestParams()
+        params._data["min_int_param"]["value"] = [
+            {"label0": "zero", "value": 1},
+            {"label0": "one", "label1": 2, "value": 2},
+        ]
+        # Value objects that do not specify all of the adjusted labels do
+        # not match, so the first adjustment is added as a new value
+        # object.
+        params.adjust(
+            {
+                "min_int_param": [
+                    {"label0": "zero", "label1": 1, "value": 3},
+                    {"label0": "one", "label1": 2, "value": 4},
+                ]
+            }
+        )
+        assert params._data["min_int_param"]["value"] == [
+            {"label0": "zero", "value": 1},
+            {"label0": "one", "label1": 2, "value": 4},
+            {"label0": "zero", "label1": 1, "value": 3},
+        ]
+
+    def test_attributes_only_reset_on_change(self, TestParams):
+        params = TestParams()
+        min_int_param = params.min_int_param
+        str_choice_param = params.str_choice_param
+        params.adjust({"min_int_param": [{"label0": "one", "value": 3}]})
+        assert params.str_choice_param is str_choice_param
+        assert params.min_int_param is not min_int_param
+        assert params.min_int_param == params.select_eq("min_int_param", False)
+
+        # No value objects match, so nothing is deleted.
+        params.adjust({"str_choice_param": [{"label0": "one", "value": None}]})
+        assert params.str_choice_param is str_choice_param
+
+        # Attributes are dropped as soon as the values change, even if
+        # the state is not set afterwards, e.g. when an adjustment fails.
+        params._update_param(
+            "min_int_param", [{"label0": "zero", "label1": 1, "value": 5}]
+        )
+        assert params.min_int_param == params.select_eq("min_int_param", False)
+        assert params.min_int_param[0]["value"] == 5
+
 
 class TestErrors:
     def test_errors_attribute(self, TestParams):
@@ -499,6 +614,12 @@ class TestArray:
         exp = params.int_dense_array_param
         assert params.from_array("int_dense_array_param", res) == exp
 
+        # value objects do not need to be in the same order as the array.
+        params._data["int_dense_array_param"]["value"].reverse()
+        assert (
+            params.to_array("int_dense_array_param").tolist() == res.tolist()
+        )
+
         params._data["int_dense_array_param"]["value"].pop(0)
 
         with pytest.raises(SparseValueObjectsException):
@@ -529,6 +650,10 @@ class TestArray:
             exp_label_order,
             exp_value_order,
         )
+        assert params._resolve_order("madeup", vi) == (
+            exp_label_order,
+            exp_value_order,
+        )
 
         # test with specified state.
         exp_value_order = {"label0": ["zero", "one"], "label2": [0, 1]}
@@ -678,6 +803,40 @@ class TestState:
         assert params.min_int_param == defaultexp
         assert params.label_grid == params._stateless_label_grid
 
+    def test_lazy_attributes(self, TestParams):
+        params = TestParams()
+        assert "min_int_param" not in params.__dict__
+        assert "min_int_param" in dir(params)
+        assert params.min_int_param == params.select_eq("min_int_param", False)
+        assert "min_int_param" in params.__dict__
+
+        params.set_state(label0="one")
+        assert "min_int_param" not in params.__dict__
+        assert params.min_int_param == [
+            {"label0": "one", "label1": 2, "value": 2}
+        ]
+
+        with pytest.raises(AttributeError):
+            params.notaparam
+
+        # Attributes of the params passed to _set_state are always updated.
+        params.clear_state()
+        assert params.min_int_param[0]["value"] == 1
+        params._data["min_int_param"]["value"] = [
+            {"label0": "zero", "label1": 1, "value": 99}
+        ]
+        params._set_state(params=["min_int_param"])
+        assert params.min_int_param[0]["value"] == 99
+
+        # Errors raised while computing an attribute do not make the
+        # parameter look missing. List parameters cannot be converted to
+        # arrays.
+        params = TestParams(array_first=True)
+        with pytest.raises(RuntimeError):
+            params.float_list_param
+        with pytest.raises(RuntimeError):
+            hasattr(params, "float_list_param")
+
     def test_set_state_errors(self, TestParams):
         params = TestParams()
         with pytest.raises(ValidationError):
@@ -726,6 +885,11 @@ class TestArrayFirst:
             == exp
         )
 
+        with pytest.raises(ValueError):
+            af_params.from_array(
+                "int_dense_array_param", np.array([[[4, 5, 6, 7]]])
+            )
+
 
 class TestCollisions:
     def test_collision_list(self):
@@ -840,6 +1004,19 @@ class TestExtend:
         params = AFParams()
         assert isinstance(params.int_dense_array_param, list)
 
+    def test_extend_list_param(self, TestParams):
+        class ExtParams(TestParams):
+            label_to_extend = "label1"
+
+        params = ExtParams()
+        exp = [
+            {"label0": "zero", "label1": label1, "value": [1, 2.0, 3.5, 4.6]}
+            for label1 in range(6)
+        ]
+        assert (
+            sorted(params.float_list_param, key=lambda vo: vo["label1"]) == exp
+        )
+
     def test_extend_categorical(self, array_first_defaults):
         array_first_defaults = {
             "schema": array_first_defaults["schema"],
@@ -1,6 +1,13 @@
 import pytest
 
-from paramtools.select import select_eq, select_ne
+from paramtools.select import (
+    select,
+    eq_func,
+    select_eq,
+    select_ne,
+    select_gt_ix,
+    select_gt_ix_eq,
+)
 
 
 @pytest.fixture
@@ -35,3 +42,37 @@ def test_select_ne(vos):
         {"d0": 1, "d1": "world", "value": 1},
         {"d0": 3, "d1": "world", "value": 1},
     ]
+
+
+def test_select_no_labels(vos):
+    assert select_eq(vos, True, labels={}) == vos
+    assert select_eq(vos, True, labels={}) is not vos
+    assert select_ne(vos, True, labels={}) == []
+
+
+def test_select_custom_agg(vos):
+    def two_matches(matches):
+        return len(matches) == 2 and all(matches)
+
+    assert select(
+        vos, True, eq_func, two_matches, {"d0": 1, "d1": "hello"}
+    ) == [{"d0": 1, "d1": "hello", "value": 1}]
+
+
+def test_select_gt_ix_eq(vos):
+    cmp_list = [3, 2, 1]
+    exp = select_eq(
+        select_gt_ix(vos, True, {"d0": 2}, cmp_list), True, {"d1": "hello"}
+    )
+    assert exp == [{"d0": 1, "d1": "hello", "value": 1}]
+    assert (
+        select_gt_ix_eq(vos, True, {"d0": 2}, {"d1": "hello"}, cmp_list) == exp
+    )
+    assert select_gt_ix_eq(vos, True, {"d0": 3}, {}, cmp_list) == vos[:3]
+
+
+def test_select_gt_ix_missing(vos):
+    with pytest.raises(ValueError):
+        select_gt_ix(vos, True, {"d0": 2}, [3, 2])
+    with pytest.raises(ValueError):
+        select_gt_ix(vos, True, {"d0": 4}, [3, 2, 1])
@@ -1,4 +1,7 @@
+from collections import OrderedDict
+
 from paramtools import (
+    read_json,
     get_leaves,
     ravel,
     consistent_labels,
@@ -7,6 +10,7 @@ from paramtools import (
     filter_labels,
     make_label_str,
 )
+from paramtools.utils import json_loads
 
 
 def test_get_leaves():
@@ -79,6 +83,27 @@ def test_hashable_value_object():
     assert hash(hashable_value_object({"value": "hello", "world": "!"}))
 
 
+def test_json_loads():
+    assert json_loads('{"hello": [1, 2.5, "world"]}') == {
+        "hello": [1, 2.5, "world"]
+    }
+    assert json_loads(b'{"hello": "world"}') == {"hello": "world"}
+    res = json_loads('{"hello": NaN}')
+    assert res["hello"] != res["hello"]
+
+
+def test_read_json(tmp_path):
+    path = tmp_path / "list.json"
+    path.write_text('[["a", 1], ["b", 2]]')
+    assert read_json(str(path)) == [["a", 1], ["b", 2]]
+    path.write_text("[1, 2]")
+    assert read_json(str(path)) == [1, 2]
+    path.write_text('{"b": 1, "a": 2}')
+    res = read_json(str(path))
+    assert isinstance(res, OrderedDict)
+    assert list(res) == ["b", "a"]
+
+
 def test_filter_labels():
     assert filter_labels({"hello": "world"}, drop=["hello"]) == {}
     assert filter_labels({"hello": "world"}, keep=["hello"]) == {
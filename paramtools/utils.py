@@ -5,19 +5,38 @@ from typing import List
 
 from paramtools.typing import ValueObject
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def read_json(path):
     """
     Read JSON file shortcut
     """
     if isinstance(path, str) and os.path.exists(path):
-        with open(path, "r") as f:
-            r = json.loads(f.read(), object_pairs_hook=OrderedDict)
-        return r
+        with open(path, "rb") as f:
+            r = json_loads(f.read())
+        return OrderedDict(r) if isinstance(r, dict) else r
     elif isinstance(path, dict):
         return path
     else:
-        return json.loads(path)
+        return json_loads(path)
+
+
+def json_loads(s):
+    """
+    Parse a JSON str or bytes object. orjson is used if it is installed.
+    Documents that orjson rejects but the standard library accepts, e.g.
+    documents containing NaN, are parsed with the json module.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(s)
 
 
 def get_example_paths(name):
@@ -61,7 +80,7 @@ def get_leaves(item):
 
 
 def ravel(nlabel_list):
-    """ only up to 2D for now. """
+    """only up to 2D for now."""
     if not isinstance(nlabel_list, list):
         return nlabel_list
     raveled = []
@@ -133,9 +152,11 @@ def make_label_str(vo: ValueObject) -> str:
 
 
 def grid_sort(vos, label_to_extend, grid):
+    idx_of = {val: ix for ix, val in enumerate(grid)}
+
     def key(v):
         if label_to_extend in v:
-            return grid.index(v[label_to_extend])
+            return idx_of[v[label_to_extend]]
         else:
             return grid[0]
 